@@ -1,17 +1,33 @@
+from __future__ import annotations
 import evdev
+try:
+    import pulsectl
+except (ImportError, OSError):
+    # keep --install/--enable-service/--disable-service usable before pulsectl (or libpulse) is installed
+    pulsectl = None
 import subprocess
 import atexit
 import argparse
 import os
+import sys
+import glob
 import getpass
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, FrozenSet, Callable
 import threading
 import queue
+import signal
+import traceback
+import time
+import select
+import fcntl
+import struct
+import ctypes
 
 # xdotool is recommended (it covers every input)\
 # add your device name if xdotool's one is not detected. (use 'sudo evtest')
-DEVICE_NAME = ("gsr-ui virtual keyboard") # search for ... or ...
-TARGET_MIC_VOLUME = "1.0"
+DEVICE_NAME: List[str] = ["gsr-ui virtual keyboard"] # search for ... or ... (first name with a match wins)
+TARGET_MIC_VOLUME = 1.0
+PULSE_STARTUP_TIMEOUT = 5.0 # seconds for connecting to PulseAudio and muting the mic at startup
 BINDS: Dict[str, List[str]] = {
     "f13": ["!all", "vesktop", "discord", "gpu-screen-recorder"],
     "f15": ["!vesktop", "!discord"],
@@ -20,104 +36,284 @@ BINDS: Dict[str, List[str]] = {
 ALL_KEYS = set()
 for k in BINDS:
     for sk in k.split():
-        ALL_KEYS.add(sk)
-ACTIVE_KEYS = set()
-def run(*args) -> str:
-    """Run a command, return stdout (stripped). Errors are printged."""
+        ALL_KEYS.add(sys.intern(sk))
+KEY_BITS: Dict[str, int] = {k: 1 << i for i, k in enumerate(sorted(ALL_KEYS))}
+# indexed by evdev key code: bound key name, or None for codes that don't appear in BINDS.
+# the kernel never reports EV_KEY codes above KEY_MAX, so lookups need no bounds check
+CODE_TABLE: List[Optional[str]] = [None] * (evdev.ecodes.KEY_MAX + 1)
+for code, key_names in evdev.ecodes.KEY.items():
+    for key_name in ([key_names] if isinstance(key_names, str) else key_names):
+        key_name = key_name.removeprefix("KEY_").lower()
+        if key_name in ALL_KEYS and code <= evdev.ecodes.KEY_MAX:
+            CODE_TABLE[code] = sys.intern(key_name)
+            break
+# held keys bitmask -> (allowed apps, muted apps), lowercased once here instead of on every keypress
+BINDS_BY_MASK: Dict[int, Tuple[FrozenSet[str], FrozenSet[str]]] = {
+    sum(KEY_BITS[sk] for sk in set(k.split())): (
+        frozenset(r.strip().lower() for r in v if not r.strip().startswith("!")),
+        frozenset(r.strip()[1:].lower() for r in v if r.strip().startswith("!")))
+    for k, v in BINDS.items()
+}
+ALLOW_ALL: Tuple[FrozenSet[str], FrozenSet[str]] = (frozenset(["all"]), frozenset())
+ACTIVE_MASK = 0
+# source-output index -> (app name, app binary, channel count), kept up to date by monitor_app_sources()
+APP_CACHE: Dict[int, Tuple[str, str, int]] = {}
+APP_CACHE_LOCK = threading.Lock()
+# fetched lazily by get_default_source(), reset by monitor_app_sources() when the server defaults change
+DEFAULT_SOURCE: Optional[pulsectl.PulseSourceInfo] = None
+# (volume, channel count) -> pa_cvolume, built once instead of for every app on every keypress
+CVOLUMES: Dict[Tuple[float, int], pulsectl._pulsectl.PA_CVOLUME] = {}
+# set by connect_pulse(); PULSE_READY only once the mic has been muted through it
+pulse: Optional[pulsectl.Pulse] = None
+PULSE_READY = threading.Event()
+# raw libpulse bindings under pulsectl, used to queue requests without waiting on each reply
+pa = pulsectl._pulsectl.pa if pulsectl else None
+# libpulse request function + its arguments (without context and callback), sent by send_pulse_ops()
+PulseOp = Tuple[Callable[..., object], tuple]
+# pulsectl clients are not thread-safe, so calls on `pulse` from different threads are serialized
+PULSE_LOCK = threading.Lock()
+def run(*args):
+    """Run a command, discarding its stdout. Errors are printed."""
     try:
-        cp = subprocess.run(args, capture_output=True, text=True, check=True)
-        return cp.stdout.strip()
+        subprocess.run(args, stdout=subprocess.DEVNULL, check=True)
     except subprocess.CalledProcessError as e:
         print(f"Command failed: {' '.join(args)} - {e}")
-        return ""
-def get_default_source() -> str:
-    return run("pactl", "get-default-source")
-def toggle_mic(src: str, state: bool):
-    print(f"{'Unmuting' if state else 'Muting'} mic: {src}")
-    run("pactl", "set-source-mute", src, "0" if state else "1")
-def set_source_volume(src: str, volume: str):
-    print(f"Setting source volume for {src} to {volume}")
-    run("pactl", "set-source-volume", src, volume)
-def get_app_sources() -> List[Tuple[str, str, str]]:
-    output = run("pactl", "list", "source-outputs")
-    if not output:
-        return []
-    sources = output.split("Source Output")
-    app_sources: List[Tuple[str, str, str]] = []
-    for source in sources:
-        index: Optional[str] = None
-        name: Optional[str] = None
-        binary: Optional[str] = None
-        for line in source.splitlines():
-            line = line.strip()
-            if line.startswith("object.serial"):
-                index = line.split(" = ")[1].replace('"', '').strip()
-            elif line.startswith("application.name"):
-                name = line.split(" = ")[1].replace('"', '').strip()
-            elif line.startswith("application.process.binary"):
-                binary = line.split(" = ")[1].replace('"', '').strip()
-        binary = binary or "unknown*"
-        if index is None or name is None:
+def get_default_source() -> pulsectl.PulseSourceInfo:
+    global DEFAULT_SOURCE
+    source = DEFAULT_SOURCE
+    if source is None:
+        source = DEFAULT_SOURCE = pulse.source_default_get()
+    return source
+def toggle_mic(ops: List[PulseOp], src: pulsectl.PulseSourceInfo, state: bool):
+    if VERBOSE:
+        print(f"{'Unmuting' if state else 'Muting'} mic: {src.name}")
+    ops.append((pa.context_set_source_mute_by_index, (src.index, int(not state))))
+def set_source_volume(ops: List[PulseOp], src: pulsectl.PulseSourceInfo, volume: float):
+    if VERBOSE:
+        print(f"Setting source volume for {src.name} to {volume}")
+    ops.append((pa.context_set_source_volume_by_index, (src.index, get_cvolume(volume, len(src.volume.values)))))
+def stop_main_thread():
+    """Bring the main thread down after a helper thread failed, so the service gets restarted."""
+    signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+def cache_app_source(app: pulsectl.PulseSourceOutputInfo):
+    name = app.proplist.get("application.name")
+    if name is None:
+        # not identifiable (yet); a later "change" event adds it once the client sets its properties
+        with APP_CACHE_LOCK:
+            APP_CACHE.pop(app.index, None)
+        return
+    binary = app.proplist.get("application.process.binary", "unknown*")
+    with APP_CACHE_LOCK:
+        APP_CACHE[app.index] = (name.lower(), binary.lower(), len(app.volume.values))
+def monitor_app_sources():
+    """Keep APP_CACHE and DEFAULT_SOURCE in sync with PulseAudio events (runs in its own thread)."""
+    global DEFAULT_SOURCE
+    try:
+        monitor = pulsectl.Pulse("ptt-monitor")
+        events: List[pulsectl.PulseEventInfo] = []
+        def on_event(ev: pulsectl.PulseEventInfo):
+            events.append(ev)
+            raise pulsectl.PulseLoopStop
+        # pulse calls are not allowed from the callback, so events are handled after event_listen() returns
+        monitor.event_callback_set(on_event)
+        monitor.event_mask_set("source_output", "server")
+        for app in monitor.source_output_list():
+            cache_app_source(app)
+        while True:
+            while events:
+                ev = events.pop(0)
+                if ev.facility == "server":
+                    # refetched here rather than lazily, so cleanup() never has to wait on a lookup
+                    try:
+                        DEFAULT_SOURCE = monitor.source_default_get()
+                    except (pulsectl.PulseIndexError, pulsectl.PulseOperationFailed):
+                        DEFAULT_SOURCE = None  # no default source right now, looked up again on the next keypress
+                elif ev.t == "new" or ev.t == "change":
+                    # "change" also covers clients that set their proplist after creating the stream
+                    try:
+                        cache_app_source(monitor.source_output_info(ev.index))
+                    except pulsectl.PulseIndexError:
+                        with APP_CACHE_LOCK:
+                            APP_CACHE.pop(ev.index, None)  # already gone
+                elif ev.t == "remove":
+                    with APP_CACHE_LOCK:
+                        APP_CACHE.pop(ev.index, None)
+            monitor.event_listen()
+    except Exception:
+        traceback.print_exc()
+        # a dead monitor would leave APP_CACHE and DEFAULT_SOURCE stale for good
+        stop_main_thread()
+def get_cvolume(volume: float, channels: int) -> pulsectl._pulsectl.PA_CVOLUME:
+    cvolume = CVOLUMES.get((volume, channels))
+    if cvolume is None:
+        cvolume = CVOLUMES[(volume, channels)] = pulsectl.PulseVolumeInfo(volume, channels).to_struct()
+    return cvolume
+def send_pulse_ops(ops: List[PulseOp], deadline: Optional[float] = None) -> int:
+    """Send every queued request before waiting on any reply, so a batch costs one round-trip.
+    Stops waiting at `deadline` (time.monotonic()) if given. Returns the number of failed or unanswered ones,
+    raises PulseDisconnected if the connection dropped."""
+    # pulsectl's setters block on each reply, so the requests are queued on its context directly
+    results: List[int] = []
+    def on_done(ctx, success, userdata):
+        results.append(success)
+        pulse._loop_stop = True  # lets a timed _pulse_poll() return as soon as a reply is in
+    done = pulsectl._pulsectl.PA_CONTEXT_SUCCESS_CB_T(on_done)
+    for func, func_args in ops:
+        pa.operation_unref(func(pulse._ctx, *func_args, done, None))
+    while pulse.connected and len(results) < len(ops):
+        if deadline is None:
+            pulse._pulse_iterate()
             continue
-        app_sources.append((index, name, binary))
-    return app_sources
-def apply_rules(rules: List[str], source: str, volume: str):
-    print(f"=== Applying rules: {rules} to source '{source}' (vol: {volume}) ===")
-    muted_apps: Dict[str, bool] = {}
-    allowed_apps: Dict[str, bool] = {}
-    for item in rules:
-        item = item.strip()
-        if item.startswith("!"):
-            target = item[1:].lower()
-            muted_apps[target] = True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        pulse._pulse_poll(remaining)
+    if not pulse.connected:
+        raise pulsectl.PulseDisconnected()
+    return len(ops) - sum(1 for ok in results if ok)
+def get_app_sources() -> List[Tuple[int, Tuple[str, str, int]]]:
+    with APP_CACHE_LOCK:
+        return list(APP_CACHE.items())
+def apply_rules(ops: List[PulseOp], allowed_apps: FrozenSet[str], muted_apps: FrozenSet[str], source: pulsectl.PulseSourceInfo, volume: float):
+    if VERBOSE:
+        print(f"=== Applying rules to source '{source.name}' (vol: {volume}) ===")
+        for target in muted_apps:
             print(f" MUTE: {target}")
-        else:
-            target = item.lower()
-            allowed_apps[target] = True
+        for target in allowed_apps:
             print(f" ALLOW: {target}")
     app_sources = get_app_sources()
     if not app_sources:
-        print(" No active apps using microphone")
-        print("=== Rule applied ===")
+        if VERBOSE:
+            print(" No active apps using microphone")
+            print("=== Rule applied ===")
         return
     app_count = 0
     muted_count = 0
     allowed_count = 0
-    for index, app_name, app_binary in app_sources:
+    for index, (app_lc, binary_lc, channels) in app_sources:
         app_count += 1
-        app_lc = app_name.lower()
-        binary_lc = app_binary.lower()
-        print(f" App #{index}: '{app_name}' (Binary: {app_binary})")
         if "all" in allowed_apps or app_lc in allowed_apps or binary_lc in allowed_apps:
             vol = volume
             action = "ALLOWED"
             allowed_count += 1
         elif "all" in muted_apps or app_lc in muted_apps or binary_lc in muted_apps:
-            vol = "0.0"
+            vol = 0.0
             action = "MUTED"
             muted_count += 1
         else:
             vol = volume
             action = "ALLOWED (default)"
             allowed_count += 1
-        run("pactl", "set-source-output-volume", index, vol)
-        print(f" -> {action} ({vol})")
-    print(f" Summary: {app_count} apps | {allowed_count} allowed ({volume}) | {muted_count} muted (0.0)")
-    print("=== Rule applied ===")
-def cleanup():
+        ops.append((pa.context_set_source_output_volume, (index, get_cvolume(vol, channels))))
+        if VERBOSE:
+            print(f" App #{index}: '{app_lc}' (Binary: {binary_lc})")
+            print(f" -> {action} ({vol})")
+    if VERBOSE:
+        print(f" Summary: {app_count} apps | {allowed_count} allowed ({volume}) | {muted_count} muted (0.0)")
+        print("=== Rule applied ===")
+def connect_pulse():
+    """Connect to PulseAudio and mute the mic. Runs in a thread while the input devices are being opened."""
+    global pulse
+    deadline = time.monotonic() + PULSE_STARTUP_TIMEOUT
+    pulse = pulsectl.Pulse("push-to-talk", connect=False)
+    pulse.connect(autospawn=True, timeout=PULSE_STARTUP_TIMEOUT)
     source = get_default_source()
-    if source:
-        toggle_mic(source, False)
-    print("Mic muted on exit")
+    print(f"Default source: {source.name}")
+    ops: List[PulseOp] = []
+    toggle_mic(ops, source, False)
+    if send_pulse_ops(ops, deadline):
+        print("Error: Could not mute mic")
+        return
+    PULSE_READY.set()
+    print("Script started - Mic muted initially")
+def apply_keys(mask: int):
+    source = get_default_source()
+    ops: List[PulseOp] = []
+    if not mask:
+        toggle_mic(ops, source, False)
+        apply_rules(ops, *ALLOW_ALL, source, TARGET_MIC_VOLUME)
+    else:
+        rules = BINDS_BY_MASK.get(mask)
+        if not rules:
+            return
+        set_source_volume(ops, source, TARGET_MIC_VOLUME)
+        apply_rules(ops, *rules, source, TARGET_MIC_VOLUME)
+        toggle_mic(ops, source, True)
+    # the server handles requests in order, so the mic is only unmuted after the app volumes are set
+    failed = send_pulse_ops(ops)
+    if failed:
+        print(f"{failed} of {len(ops)} PulseAudio requests failed")
+def apply_worker(work_q: "queue.SimpleQueue[int]"):
+    """Apply held-keys masks posted by the event loop, skipping any that were superseded while busy."""
+    while True:
+        mask = work_q.get()
+        while not work_q.empty():
+            mask = work_q.get_nowait()
+        try:
+            with PULSE_LOCK:
+                apply_keys(mask)
+        except Exception:
+            traceback.print_exc()
+            stop_main_thread()
+            return
+def cleanup():
+    # everything here is bounded to ~100ms, so a stuck worker or a hung server can't hold up stopping the service
+    deadline = time.monotonic() + 0.1
+    if not PULSE_LOCK.acquire(timeout=0.1):
+        print("PulseAudio client busy, mic not muted on exit")
+        return
+    try:
+        # during logout the server is often gone already, then there is nothing left to mute
+        source = DEFAULT_SOURCE
+        if not pulse.connected or source is None:
+            print("PulseAudio unavailable, mic not muted on exit")
+            return
+        ops: List[PulseOp] = []
+        toggle_mic(ops, source, False)
+        if send_pulse_ops(ops, deadline):
+            print("PulseAudio did not confirm, mic may not be muted on exit")
+        else:
+            print("Mic muted on exit")
+    except (pulsectl.PulseError, pulsectl.PulseDisconnected, pa.CallError):
+        print("PulseAudio unavailable, mic not muted on exit")
+    finally:
+        PULSE_LOCK.release()
+# struct input_event from linux/input.h: timeval sec, usec, type, code, value
+INPUT_EVENT = struct.Struct("llHHi")
+# _IOW('E', 0x93, struct input_mask) from linux/input.h
+EVIOCSMASK = 0x40104593
+def bitmap_size(bits: int) -> int:
+    """Bytes for a kernel bitmap of `bits` bits; the kernel rejects sizes that aren't whole longs."""
+    long_bits = ctypes.sizeof(ctypes.c_long) * 8
+    return (bits + long_bits - 1) // long_bits * ctypes.sizeof(ctypes.c_long)
+def mask_device_events(dev: evdev.InputDevice):
+    """Ask the kernel to deliver only the bound keys on this fd, so regular typing never wakes the event loop."""
+    type_bits = bytearray(bitmap_size(evdev.ecodes.EV_MAX + 1))
+    type_bits[evdev.ecodes.EV_KEY // 8] |= 1 << (evdev.ecodes.EV_KEY % 8)
+    key_bits = bytearray(bitmap_size(evdev.ecodes.KEY_MAX + 1))
+    for code, key in enumerate(CODE_TABLE):
+        if key is not None:
+            key_bits[code // 8] |= 1 << (code % 8)
+    # the EV_SYN slot holds the mask of event types, the EV_KEY slot the mask of key codes
+    for ev_type, bits in ((evdev.ecodes.EV_SYN, type_bits), (evdev.ecodes.EV_KEY, key_bits)):
+        buf = ctypes.create_string_buffer(bytes(bits), len(bits))
+        try:
+            fcntl.ioctl(dev.fd, EVIOCSMASK, struct.pack("IIQ", ev_type, len(bits), ctypes.addressof(buf)))
+        except OSError as e:
+            print(f"Could not set event mask on {dev.path} - {e}")
+            return
 def find_device_paths() -> List[str]:
     found_paths: List[str] = []
     found_names: List[str] = []
     devices: Dict[str, str] = {}
-    for path in evdev.list_devices():
-        print(path)
-        dev = evdev.InputDevice(path)
-        name_lc = dev.name.lower()
-        devices[path] = dev.name
+    # names come from sysfs, so only the matched nodes ever get opened
+    for name_path in glob.glob("/sys/class/input/event*/device/name"):
+        node = name_path.split("/")[4]
+        try:
+            with open(name_path) as f:
+                devices[f"/dev/input/{node}"] = f.read().rstrip("\n")
+        except OSError:
+            continue
     for want in DEVICE_NAME:
         for path, name in devices.items():
             if want == name and path not in found_paths:
@@ -129,14 +325,16 @@ def find_device_paths() -> List[str]:
     print(f"No matching device found (wanted: {DEVICE_NAME})")
     return []
 parser = argparse.ArgumentParser(description="Push to talk script")
-parser.add_argument('--install', action='store_true', help='Install required packages (xdotool, python-evdev)')
+parser.add_argument('--install', action='store_true', help='Install required packages (xdotool, python-evdev, python-pulsectl)')
 parser.add_argument('--enable-service', action='store_true', help='Enable and start the systemd user service')
 parser.add_argument('--disable-service', action='store_true', help='Disable and stop the systemd user service')
+parser.add_argument('--verbose', action='store_true', help='Print every key event and applied rule')
 args = parser.parse_args()
+VERBOSE = args.verbose
 handled = False
 if args.install:
     print("Installing required packages...")
-    subprocess.run(['sudo', 'pacman', '-S', '--needed', 'xdotool', 'python-evdev'])
+    subprocess.run(['sudo', 'pacman', '-S', '--needed', 'xdotool', 'python-evdev', 'python-pulsectl'])
     current_user = getpass.getuser()
     print(f"\nTo allow access to input devices without root, run:")
     print(f"sudo usermod -aG input {current_user}")
@@ -176,52 +374,55 @@ if handled:
     exit(0)
 # Main script execution
 if __name__ == "__main__":
-    atexit.register(cleanup)
-    source = get_default_source()
-    print(f"Default source: {source}")
-    toggle_mic(source, False)
-    print("Script started - Mic muted initially")
+    if pulsectl is None:
+        print("Error: python-pulsectl is not installed, run this script with --install")
+        exit(1)
+    # helper threads inherit this mask, so SIGINT/SIGTERM always land on (and interrupt) the main thread.
+    # it is only held while threads are started, so a hung PulseAudio can't make startup unkillable
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
+    pulse_thread = threading.Thread(target=connect_pulse, daemon=True)
+    pulse_thread.start()
+    threading.Thread(target=monitor_app_sources, daemon=True).start()
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGINT, signal.SIGTERM})
     device_paths = find_device_paths()
     if not device_paths:
         print("Error: Could not find device")
         exit(1)
-    event_queue = queue.Queue()
-    def read_device(path, q):
-        dev = evdev.InputDevice(path)
-        for event in dev.read_loop():
-            q.put(event)
-    threads = []
-    for path in device_paths:
-        t = threading.Thread(target=read_device, args=(path, event_queue))
-        t.daemon = True
-        t.start()
-        threads.append(t)
+    devices = [evdev.InputDevice(path) for path in device_paths]
+    ep = select.epoll()
+    for dev in devices:
+        mask_device_events(dev)
+        ep.register(dev.fd, select.EPOLLIN)
+    pulse_thread.join()
+    if not PULSE_READY.is_set():
+        print("Error: Could not connect to PulseAudio and mute the mic")
+        exit(1)
+    atexit.register(cleanup)
+    work_q: "queue.SimpleQueue[int]" = queue.SimpleQueue()
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
+    threading.Thread(target=apply_worker, args=(work_q,), daemon=True).start()
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGINT, signal.SIGTERM})
+    # exit normally on systemd's stop, so atexit mutes the mic
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     print(f"Listening for keys from {device_paths}")
     while True:
-        event = event_queue.get()
-        if event.type != evdev.ecodes.EV_KEY or event.value == 2:
-            continue
-        key_name = evdev.ecodes.KEY.get(event.code)
-        if not key_name:
-            continue
-        key = str(key_name).removeprefix("KEY_").lower()
-        if key not in ALL_KEYS:
-            continue
-        source = get_default_source()
-        if event.value == 1:  # Press
-            ACTIVE_KEYS.add(key)
-            print(f"KEY {key.upper()} pressed")
-        elif event.value == 0:  # Release
-            if key in ACTIVE_KEYS:
-                ACTIVE_KEYS.remove(key)
-            print(f"KEY {key.upper()} released")
-        if not ACTIVE_KEYS:
-            toggle_mic(source, False)
-            apply_rules(["all"], source, TARGET_MIC_VOLUME)
-            continue
-        rules_key = " ".join(sorted(ACTIVE_KEYS))
-        rules = BINDS.get(rules_key)
-        if rules:
-            set_source_volume(source, TARGET_MIC_VOLUME)
-            apply_rules(rules, source, TARGET_MIC_VOLUME)
-            toggle_mic(source, True)
+        prev_mask = ACTIVE_MASK
+        for fd, _ in ep.poll():
+            # one read drains up to 64 queued events; raw unpacking skips building an InputEvent per event
+            for _, _, ev_type, code, value in INPUT_EVENT.iter_unpack(os.read(fd, INPUT_EVENT.size * 64)):
+                if ev_type != evdev.ecodes.EV_KEY or value == 2:
+                    continue
+                key = CODE_TABLE[code]
+                if key is None:
+                    continue
+                if value == 1:  # Press
+                    ACTIVE_MASK |= KEY_BITS[key]
+                    if VERBOSE:
+                        print(f"KEY {key.upper()} pressed")
+                elif value == 0:  # Release
+                    ACTIVE_MASK &= ~KEY_BITS[key]
+                    if VERBOSE:
+                        print(f"KEY {key.upper()} released")
+        # hand over once per batch, and only if the batch actually changed the held keys
+        if ACTIVE_MASK != prev_mask:
+            work_q.put(ACTIVE_MASK)